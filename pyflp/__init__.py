@@ -60,7 +60,8 @@ from pyflp.project import VALID_PPQS, FileFormat, Project, ProjectID
 
 __all__ = ["parse", "save"]
 
-FLP_HEADER = struct.Struct("4sIh2H")
+FLP_HEADER = struct.Struct("<4sIh2H")
+FLP_DATA_HEADER = struct.Struct("<4sI")
 
 if sys.version_info < (3, 11):  # https://github.com/Bobronium/fastenum/issues/2
     import fastenum
@@ -103,27 +104,32 @@ def parse(file: pathlib.Path | str) -> Project:
     if ppq not in VALID_PPQS:
         raise HeaderCorrupted("Invalid PPQ")
 
-    if stream.read(4) != b"FLdt":
+    try:
+        data_magic, events_size = FLP_DATA_HEADER.unpack(stream.read(FLP_DATA_HEADER.size))
+    except struct.error as exc:  # pragma: no cover
+        raise HeaderCorrupted("Data chunk size couldn't be read") from exc
+
+    if data_magic != b"FLdt":
         raise HeaderCorrupted("Unexpected data chunk magic; expected 'FLdt'")
 
-    events_size = int.from_bytes(stream.read(4), "little")
     if not events_size:  # pragma: no cover
         raise HeaderCorrupted("Data chunk size couldn't be read")
 
+    events_start = stream.tell()
     stream.seek(0, os.SEEK_END)
     file_size = stream.tell()
-    if file_size != events_size + 22:
+    if file_size != events_size + events_start:
         raise HeaderCorrupted("Data chunk size corrupted")
 
     plug_name = None
     str_type: type[AsciiEvent] | type[UnicodeEvent] | None = None
-    stream.seek(22)  # Back to start of events
+    stream.seek(events_start)  # Back to start of events
     while stream.tell() < file_size:
         event_type: type[AnyEvent] | None = None
         # Conditional fix for Windows with Python 3.13+
-        if platform.system() == "Windows" and sys.version_info >= (3, 13):
-            id = int.from_bytes(stream.read(1))  # Workaround for affected environments
-            else:
+        if sys.platform == "win32" and sys.version_info >= (3, 13):
+            id = int.from_bytes(stream.read(1), "little")  # Workaround for affected environments
+        else:
             id = EventEnum(int.from_bytes(stream.read(1), "little"))  # Default behavior
         if id < WORD:
             value = stream.read(1)
@@ -154,16 +160,9 @@ def parse(file: pathlib.Path | str) -> Project:
                 event_type = U16Event
             elif id < TEXT:
                 event_type = U32Event
-            # Conditional fix for Windows with Python 3.13+
-            elif platform.system() == "Windows" and sys.version_info >= (3, 13):
-                 if id < DATA or id in NEW_TEXT_IDS:  # Workaround for affected environments
-                     if str_type is None:  # pragma: no cover
-                         raise VersionNotDetected  # ! This should never happen
-                     event_type = str_type
-             # Default behavior for unaffected users
-             elif id < DATA or id.value in NEW_TEXT_IDS:  # Original logic retained
-                 if str_type is None:  # pragma: no cover
-                     raise VersionNotDetected  # ! This should never happen
+            elif id < DATA or id in NEW_TEXT_IDS:
+                if str_type is None:  # pragma: no cover
+                    raise VersionNotDetected  # ! This should never happen
                 event_type = str_type
 
                 if id == PluginID.InternalName:
@@ -193,17 +192,17 @@ def save(project: Project, file: pathlib.Path | str) -> None:
         project: The object returned by :meth:`parse`.
         file: The file in which the contents of :attr:`project` are serialised back.
     """
-    buf = bytearray()
     num_channels = len(project.channels)
     header = FLP_HEADER.pack(b"FLhd", 6, project.format, num_channels, project.ppq)
-    buf.extend(header)
-    buf.extend(b"FLdt" + (b"\0" * 4))
-    total_size = 0
-    for event in project.events:
-        raw = bytes(event)
-        total_size += len(raw)
-        buf.extend(raw)
-    buf[18:22] = total_size.to_bytes(4, "little")
-
-    with open(file, "wb") as fp:
-        fp.write(buf)
+
+    # Every event is serialised before the file is opened, so that a failure
+    # leaves it untouched. Their bytes are kept as they are and written one
+    # after the other, rather than being copied into one growing buffer.
+    events = [bytes(event) for event in project.events]
+    total_size = sum(map(len, events))
+
+    # A 1 MiB buffer coalesces the many tiny event writes into few syscalls.
+    with open(file, "wb", buffering=1 << 20) as fp:
+        fp.write(header)
+        fp.write(FLP_DATA_HEADER.pack(b"FLdt", total_size))
+        fp.writelines(events)
@@ -21,22 +21,25 @@ from __future__ import annotations
 
 import abc
 import enum
+import functools
+import struct
+import sys
 import warnings
 from collections.abc import Callable, Iterable, Iterator, Sequence
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from itertools import zip_longest
 from typing import TYPE_CHECKING, Any, ClassVar, Final, Generic, Tuple, cast
 
 import construct as c
 from sortedcontainers import SortedList
-from typing_extensions import Concatenate, TypeAlias
+from typing_extensions import TypeAlias
 
 from pyflp.exceptions import (
     EventIDOutOfRange,
     InvalidEventChunkSize,
     PropertyCannotBeSet,
 )
-from pyflp.types import RGBA, P, T, AnyContainer, AnyListContainer, AnyList, AnyDict
+from pyflp.types import RGBA, T, AnyContainer, AnyListContainer, AnyList, AnyDict
 
 BYTE: Final = 0
 WORD: Final = 64
@@ -57,7 +60,11 @@ class _EventEnumMeta(enum.EnumMeta):
         Args:
             obj: Can be an ``int`` or an ``EventEnum``.
         """
-        return obj in tuple(self)
+        ids: frozenset[EventEnum] | None = self.__dict__.get("_ids")
+        if ids is None:  # Members never change after class creation
+            ids = frozenset(self)
+            setattr(self, "_ids", ids)
+        return obj in ids
 
 
 class EventEnum(int, enum.Enum, metaclass=_EventEnumMeta):
@@ -104,6 +111,8 @@ class EventBase(Generic[T]):
 
     STRUCT: c.Construct[T, T]
     ALLOWED_IDS: ClassVar[Sequence[int]] = []
+    PACKER: ClassVar[struct.Struct | None] = None
+    """Precompiled ID + value layout; bypasses :attr:`STRUCT` when serialising."""
 
     def __init__(self, id: EventEnum, data: bytes, **kwds: Any) -> None:
         if self.ALLOWED_IDS and id not in self.ALLOWED_IDS:
@@ -120,11 +129,11 @@ class EventBase(Generic[T]):
             if len(data) != expected_size:
                 raise InvalidEventChunkSize(expected_size, len(data))
 
-            # Conditional fix for Windows with Python 3.13+
-            if platform.system() == "Windows" and sys.version_info >= (3, 13):
-                self.id = id  # Apply workaround for affected environments
-            else:
-                self.id = EventEnum(id)  # Default behavior for unaffected environments
+        # Conditional fix for Windows with Python 3.13+
+        if sys.platform == "win32" and sys.version_info >= (3, 13):
+            self.id = id  # Apply workaround for affected environments
+        else:
+            self.id = EventEnum(id)  # Default behavior for unaffected environments
         self._kwds = kwds
         self.value = self.STRUCT.parse(data, **self._kwds)
 
@@ -139,6 +148,16 @@ class EventBase(Generic[T]):
         return self.id != o.id or self.value != cast(EventBase[T], o).value
 
     def __bytes__(self) -> bytes:
+        if self.PACKER is not None:
+            try:
+                return self.PACKER.pack(self.id, self.value)
+            except struct.error as exc:  # Raise what STRUCT.build() would
+                raise c.FormatFieldError(
+                    f"struct {self.PACKER.format!r} error during building, "
+                    f"given value {self.value!r}",
+                    path="(building)",
+                ) from exc
+
         id = c.Byte.build(self.id)
         data = self.STRUCT.build(self.value, **self._kwds)
 
@@ -156,7 +175,9 @@ class EventBase(Generic[T]):
         """Serialised event size (in bytes)."""
 
         if self.id >= TEXT:
-            return len(bytes(self))
+            # Only the data needs building; the VarInt stores 7 bits per byte.
+            data_size = len(self.STRUCT.build(self.value, **self._kwds))
+            return 1 + max(1, -(-data_size.bit_length() // 7)) + data_size
         elif self.id >= DWORD:
             return 5
         elif self.id >= WORD:
@@ -190,18 +211,21 @@ class BoolEvent(ByteEventBase[bool]):
     """An event used for storing a boolean."""
 
     STRUCT = c.Flag
+    PACKER = struct.Struct("<B?")
 
 
 class I8Event(ByteEventBase[int]):
     """An event used for storing a 1 byte signed integer."""
 
     STRUCT = c.Int8sl
+    PACKER = struct.Struct("<Bb")
 
 
 class U8Event(ByteEventBase[int]):
     """An event used for storing a 1 byte unsigned integer."""
 
     STRUCT = c.Int8ul
+    PACKER = struct.Struct("<BB")
 
 
 class WordEventBase(EventBase[int], abc.ABC):
@@ -226,12 +250,14 @@ class I16Event(WordEventBase):
     """An event used for storing a 2 byte signed integer."""
 
     STRUCT = c.Int16sl
+    PACKER = struct.Struct("<Bh")
 
 
 class U16Event(WordEventBase):
     """An event used for storing a 2 byte unsigned integer."""
 
     STRUCT = c.Int16ul
+    PACKER = struct.Struct("<BH")
 
 
 class DWordEventBase(EventBase[T], abc.ABC):
@@ -256,18 +282,21 @@ class F32Event(DWordEventBase[float]):
     """An event used for storing 4 byte floats."""
 
     STRUCT = c.Float32l
+    PACKER = struct.Struct("<Bf")
 
 
 class I32Event(DWordEventBase[int]):
     """An event used for storing a 4 byte signed integer."""
 
     STRUCT = c.Int32sl
+    PACKER = struct.Struct("<Bi")
 
 
 class U32Event(DWordEventBase[int]):
     """An event used for storing a 4 byte unsigned integer."""
 
     STRUCT = c.Int32ul
+    PACKER = struct.Struct("<BI")
 
 
 class U16TupleEvent(DWordEventBase[Tuple[int, int]]):
@@ -388,24 +417,30 @@ class UnknownDataEvent(EventBase[bytes]):
     STRUCT = c.GreedyBytes
 
 
-@dataclass(order=True)
+@functools.total_ordering
+@dataclass(eq=False)
 class IndexedEvent:
+    # One of these exists for every event and they are compared constantly
+    # by SortedList; slots make them smaller and their attributes faster.
+    __slots__ = ("r", "e")
+
     r: int
     """Root index of occurence of :attr:`e`."""
 
-    e: AnyEvent = field(compare=False)
+    e: AnyEvent
     """The indexed event."""
 
+    def __eq__(self, o: object) -> bool:
+        if not isinstance(o, IndexedEvent):
+            return NotImplemented
+        return self.r == o.r
 
-def yields_child(func: Callable[Concatenate[EventTree, P], Iterator[EventTree]]):
-    """Adds an :class:`EventTree` to its parent's list of children and yields it."""
-
-    def wrapper(self: EventTree, *args: P.args, **kwds: P.kwargs):
-        for child in func(self, *args, **kwds):
-            self.children.append(child)
-            yield child
-
-    return wrapper
+    # Written by hand so that only :attr:`r` is compared, directly, on the
+    # hot SortedList path; total_ordering derives the rest from this.
+    def __lt__(self, o: object) -> bool:
+        if not isinstance(o, IndexedEvent):
+            return NotImplemented
+        return self.r < o.r
 
 
 class EventTree:
@@ -427,6 +462,7 @@ class EventTree:
         """Create a new dictionary with an optional :attr:`parent`."""
         self.children: list[EventTree] = []
         self.lst: list[IndexedEvent] = SortedList(init or [])  # type: ignore
+        self._index: dict[EventEnum, list[IndexedEvent]] | None = None
 
         self.parent = parent
         if parent is not None:
@@ -438,7 +474,7 @@ class EventTree:
 
     def __contains__(self, id: EventEnum) -> bool:
         """Whether the key :attr:`id` exists in the list."""
-        return any(ie.e.id == id for ie in self.lst)
+        return id in self._id_index
 
     def __eq__(self, o: object) -> bool:
         """Compares equality of internal lists."""
@@ -462,14 +498,27 @@ class EventTree:
         return f"EventTree({len(self.ids)} IDs, {len(self)} events)"
 
     def _get_ie(self, *ids: EventEnum) -> Iterator[IndexedEvent]:
+        if len(ids) == 1:
+            return iter(self._id_index.get(ids[0], ()))
         return (ie for ie in self.lst if ie.e.id in ids)
 
+    @property
+    def _id_index(self) -> dict[EventEnum, list[IndexedEvent]]:
+        """Events grouped by their IDs, in order. Built lazily after mutations."""
+        if self._index is None:
+            self._index = {}
+            for ie in self.lst:
+                self._index.setdefault(ie.e.id, []).append(ie)
+        return self._index
+
     def _recursive(self, action: Callable[[EventTree], None]) -> None:
         """Recursively performs :attr:`action` on self and all parents."""
         action(self)
+        self._index = None
         ancestor = self.parent
         while ancestor is not None:
             action(ancestor)
+            ancestor._index = None
             ancestor = ancestor.parent
 
     def append(self, event: AnyEvent) -> None:
@@ -478,9 +527,8 @@ class EventTree:
 
     def count(self, id: EventEnum) -> int:
         """Returns the count of the events with :attr:`id`."""
-        return len(list(self._get_ie(id)))
+        return len(self._id_index.get(id, ()))
 
-    @yields_child
     def divide(self, separator: EventEnum, *ids: EventEnum) -> Iterator[EventTree]:
         """Yields subtrees containing events separated by ``separator`` infinitely."""
         el: list[IndexedEvent] = []
@@ -503,16 +551,14 @@ class EventTree:
         Raises:
             KeyError: An event with :attr:`id` isn't found.
         """
-        try:
-            return next(self.get(id))
-        except StopIteration as exc:
-            raise KeyError(id) from exc
+        if id not in self._id_index:
+            raise KeyError(id)
+        return self._id_index[id][0].e
 
     def get(self, *ids: EventEnum) -> Iterator[AnyEvent]:
         """Yields events whose ID is one of :attr:`ids`."""
-        return (e for e in self if e.id in ids)
+        return (ie.e for ie in self._get_ie(*ids))
 
-    @yields_child
     def group(self, *ids: EventEnum) -> Iterator[EventTree]:
         """Yields EventTrees of zip objects of events with matching :attr:`ids`."""
         for iet in zip_longest(*(self._get_ie(id) for id in ids)):  # unpack magic
@@ -520,7 +566,7 @@ class EventTree:
 
     def insert(self, pos: int, e: AnyEvent) -> None:
         """Inserts :attr:`ev` at :attr:`pos` in this and all parent trees."""
-        rootidx = sorted(self.indexes)[pos] if len(self) else 0
+        rootidx = self.lst[pos].r if len(self) else 0  # lst is already sorted
 
         # Shift all root indexes after rootidx by +1 to prevent collisions
         # while sorting the entire list by root indexes before serialising.
@@ -532,10 +578,10 @@ class EventTree:
 
     def pop(self, id: EventEnum, pos: int = 0) -> AnyEvent:
         """Pops the event with ``id`` at ``pos`` in ``self`` and all parents."""
-        if id not in self.ids:
+        if id not in self:
             raise KeyError(id)
 
-        ie = [ie for ie in self.lst if ie.e.id == id][pos]
+        ie = self._id_index[id][pos]
         self._recursive(lambda et: et.lst.remove(ie))
 
         # Shift all root indexes of events after rootidx by -1.
@@ -549,7 +595,6 @@ class EventTree:
         """Removes the event with ``id`` at ``pos`` in ``self`` and all parents."""
         self.pop(id, pos)
 
-    @yields_child
     def separate(self, id: EventEnum) -> Iterator[EventTree]:
         """Yields a separate ``EventTree`` for every event with matching ``id``."""
         yield from (EventTree(self, [ie]) for ie in self._get_ie(id))
@@ -565,11 +610,8 @@ class EventTree:
         for ie in self.lst:
             if select(ie.e):
                 el.append(ie)
-        obj = EventTree(self, el)
-        self.children.append(obj)
-        return obj
+        return EventTree(self, el)  # Adds itself to children
 
-    @yields_child
     def subtrees(
         self, select: Callable[[AnyEvent], bool | None], repeat: int
     ) -> Iterator[EventTree]:
@@ -597,7 +639,7 @@ class EventTree:
 
     @property
     def ids(self) -> frozenset[EventEnum]:
-        return frozenset(ie.e.id for ie in self.lst)
+        return frozenset(self._id_index)
 
     @property
     def indexes(self) -> frozenset[int]:
@@ -17,7 +17,7 @@ from __future__ import annotations
 
 import enum
 from collections import defaultdict
-from typing import DefaultDict, Iterator, cast
+from typing import DefaultDict, Final, Iterator, cast
 
 import construct as c
 
@@ -314,6 +314,9 @@ class Pattern(EventModel):
         yield from (TimeMarker(et) for et in self.events.group(*TimeMarkerID))
 
 
+_PATTERN_MARKER_IDS: Final = frozenset((*PatternID, *TimeMarkerID))
+
+
 class Patterns(EventModel, ModelCollection[Pattern]):
     def __str__(self) -> str:
         iids = [pattern.iid for pattern in self]
@@ -346,13 +349,11 @@ class Patterns(EventModel, ModelCollection[Pattern]):
             if ie.e.id == PatternID.New:
                 cur_pat_id = ie.e.value
 
-            if ie.e.id in (*PatternID, *TimeMarkerID):
+            if ie.e.id in _PATTERN_MARKER_IDS:
                 tmp_dict[cur_pat_id].append(ie)
 
         for events in tmp_dict.values():
-            et = EventTree(self.events, events)
-            self.events.children.append(et)
-            yield Pattern(et)
+            yield Pattern(EventTree(self.events, events))  # Adds itself to children
 
     def __len__(self) -> int:
         """Returns the number of patterns found in the project.
@@ -424,11 +424,11 @@ class PluginProp(RWProperty[AnyPlugin]):
         if owner is None:
             return NotImplemented
 
-        try:
-            data_event = ins.events.first(PluginID.Data)
-        except KeyError:
+        if PluginID.Data not in ins.events:
             return None
 
+        data_event = ins.events.first(PluginID.Data)
+
         if isinstance(data_event, UnknownDataEvent):
             return _PluginBase(self._get_plugin_events(ins))
 
@@ -17,8 +17,10 @@ from __future__ import annotations
 
 import datetime
 import enum
+import functools
 import math
 import pathlib
+import string
 from typing import Final, Literal, cast
 
 import construct as c
@@ -61,6 +63,22 @@ MIN_TEMPO: Final = 10.000
 VALID_PPQS: Final = (24, 48, 72, 96, 120, 144, 168, 192, 384, 768, 960)
 """PPQs / timebase supported by FL Studio as of its latest version."""
 
+# Built once, so that the ``select`` callbacks of the model properties below
+# do a single hash lookup per event instead of unpacking enums into a tuple.
+_ARRANGEMENT_IDS: Final = frozenset((*ArrangementID, *ArrangementsID, *TrackID))
+_RACK_IDS: Final = frozenset((*ChannelID, *DisplayGroupID, *RackID))
+_CHANNEL_IDS: Final = _RACK_IDS | frozenset(PluginID)
+_MIXER_IDS: Final = frozenset((*MixerID, *InsertID, *SlotID))
+_PATTERN_IDS: Final = frozenset((*PatternID, *PatternsID))
+
+# Code points a decoded licensee character can have; it is always ASCII.
+_LICENSEE_CHARS: Final = frozenset(map(ord, string.ascii_letters + string.digits))
+
+
+@functools.lru_cache(maxsize=16)
+def _parse_version(value: str) -> FLVersion:
+    return FLVersion(*tuple(int(part) for part in value.split(".")))
+
 
 class TimestampEvent(StructEventBase):
     STRUCT = c.Struct("created_on" / c.Float64l, "time_spent" / c.Float64l).compile()
@@ -170,7 +188,7 @@ class Project(EventModel):
             if e.id in TimeMarkerID and arrnew_occured:
                 return True
 
-            if e.id in (*ArrangementID, *ArrangementsID, *TrackID):
+            if e.id in _ARRANGEMENT_IDS:
                 return True
 
         return Arrangements(
@@ -208,12 +226,20 @@ class Project(EventModel):
     @property
     def channels(self) -> ChannelRack:
         """Provides an iterator over channels and channel rack properties."""
+        inserts_began = False
 
-        def select(e: AnyEvent) -> bool | None:
+        def select(e: AnyEvent) -> Literal[True] | None:
+            nonlocal inserts_began
+
+            # * Plugin events after this belong to mixer slots, but some rack
+            # events like RackID.WindowHeight occur after the inserts as well.
+            # This relies on InsertID.Flags preceding the PluginID events of
+            # every slot; if a format change breaks that, slot plugin events
+            # get attached to the last channel again.
             if e.id == InsertID.Flags:
-                return False
+                inserts_began = True
 
-            if e.id in (*ChannelID, *DisplayGroupID, *PluginID, *RackID):
+            if e.id in (_RACK_IDS if inserts_began else _CHANNEL_IDS):
                 return True
 
         return ChannelRack(
@@ -304,7 +330,7 @@ class Project(EventModel):
                 c1 = ord(char) - 26 + idx
                 c2 = ord(char) + 49 + idx
                 for num in c1, c2:
-                    if chr(num).isalnum():
+                    if num in _LICENSEE_CHARS:
                         licensee.append(num)
                         break
 
@@ -345,7 +371,7 @@ class Project(EventModel):
 
         def select(e: AnyEvent) -> Literal[True] | None:
             nonlocal inserts_began
-            if e.id in (*MixerID, *InsertID, *SlotID):
+            if e.id in _MIXER_IDS:
                 # TODO Find a more reliable to detect when inserts start.
                 inserts_began = True
                 return True
@@ -370,7 +396,7 @@ class Project(EventModel):
             elif e.id in TimeMarkerID and not arrnew_occured:
                 return True
 
-            elif e.id in (*PatternID, *PatternsID):
+            elif e.id in _PATTERN_IDS:
                 return True
 
         return Patterns(self.events.subtree(select))
@@ -520,7 +546,7 @@ class Project(EventModel):
             ValueError: When a string with an invalid format is tried to be set.
         """
         event = cast(AsciiEvent, self.events.first(ProjectID.FLVersion))
-        return FLVersion(*tuple(int(part) for part in event.value.split(".")))
+        return _parse_version(event.value)
 
     @version.setter
     def version(self, value: FLVersion | str | tuple[int, ...]) -> None:
@@ -17,6 +17,8 @@ from pyflp.channel import (
     Sampler,
     StretchMode,
 )
+from pyflp.mixer import InsertID
+from pyflp.plugin import PluginID
 from pyflp.project import Project
 
 from .conftest import get_model
@@ -58,6 +60,11 @@ def test_channels(project: Project, rack: ChannelRack):
     assert not rack.swing
 
 
+def test_channels_exclude_slot_plugins(project: Project, rack: ChannelRack):
+    inserts_began = min(ie.r for ie in project.events.lst if ie.e.id == InsertID.Flags)
+    assert not [ie for ie in rack.events.lst if ie.r > inserts_began and ie.e.id in PluginID]
+
+
 def test_automation_lfo():
     lfo = load_automation("automation-lfo.fst").lfo
     assert lfo.amount == 64
@@ -1,8 +1,9 @@
 from __future__ import annotations
 
+import construct as c
 import pytest
 
-from pyflp._events import AsciiEvent, EventEnum, EventTree, U8Event, WORD
+from pyflp._events import TEXT, WORD, AsciiEvent, EventEnum, EventTree, IndexedEvent, U8Event
 from pyflp.exceptions import EventIDOutOfRange, InvalidEventChunkSize
 
 
@@ -19,12 +20,54 @@ def test_invalid_chunk_size():
         U8Event(EventEnum(0), b"12")
 
 
+def test_invalid_value():
+    event = U8Event(EventEnum(0), b"\x01")
+    event.value = 1000
+    with pytest.raises(c.FormatFieldError):
+        bytes(event)
+
+
+def test_event_size():
+    assert U8Event(EventEnum(0), b"\x01").size == 2
+    for text in (b"\0", b"PyFLP" * 100 + b"\0"):
+        event = AsciiEvent(EventEnum(TEXT), text)
+        assert event.size == len(bytes(event))
+
+
 def test_event_tree():
     root = EventTree()
     child = EventTree(root)
     assert child in root.children
     event = U8Event(EventEnum(0), b"\x01")
+    assert EventEnum(0) not in root
     child.append(event)
     assert root.first(EventEnum(0)) == event
+    assert root.count(EventEnum(0)) == 1
     child.remove(EventEnum(0))
+    assert EventEnum(0) not in root.ids
     assert not root
+
+
+def test_event_tree_insert():
+    first, second = U8Event(EventEnum(0), b"\x01"), U8Event(EventEnum(1), b"\x02")
+    root = EventTree(init=[IndexedEvent(0, first), IndexedEvent(1, second)])
+    event = U8Event(EventEnum(2), b"\x03")
+    root.insert(1, event)
+    assert list(root) == [first, event, second]
+    assert sorted(root.indexes) == [0, 1, 2]
+
+
+def test_event_tree_children():
+    events = [U8Event(EventEnum(0), b"\x01"), U8Event(EventEnum(0), b"\x02")]
+    root = EventTree(init=[IndexedEvent(r, e) for r, e in enumerate(events)])
+    root.subtree(lambda e: True)
+    assert len(root.children) == 1
+    list(root.separate(EventEnum(0)))
+    assert len(root.children) == 3
+
+
+def test_indexed_event_ordering():
+    first, second = (IndexedEvent(r, U8Event(EventEnum(0), b"\x00")) for r in (0, 1))
+    assert first < second and second >= first
+    with pytest.raises(TypeError):
+        first < 1  # type: ignore[operator]
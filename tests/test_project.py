@@ -4,6 +4,7 @@ import datetime
 import pathlib
 import textwrap
 
+import construct as c
 import pytest
 
 import pyflp
@@ -65,3 +66,17 @@ def test_null_check(project: Project, tmp_path: pathlib.Path):
     b2 = open(tmp_path / "null_check.flp", "rb").read()
     # result = b1 == b2  # ! Don't compare 2 big bytes objects in pytest EVER
     assert b1 == b2
+
+
+def test_failed_save_keeps_file(tmp_path: pathlib.Path):
+    path = tmp_path / "failed_save.flp"
+    path.write_bytes((pathlib.Path(__file__).parent / "assets" / "FL 20.8.4.flp").read_bytes())
+    original = path.read_bytes()
+    project = pyflp.parse(path)
+    project.main_pitch = 10**6
+
+    with pytest.raises(c.ConstructError):
+        pyflp.save(project, path)
+
+    assert path.read_bytes() == original
+    assert list(tmp_path.iterdir()) == [path]